@@ -1873,6 +1873,11 @@ class ApiGatewayResolver(BaseRouter):
             generate_swagger_html,
         )
 
+        # Neither the embedded assets nor the generated spec change between requests, so we build them once.
+        # The spec is keyed by base path, since it is used as the default server URL.
+        swagger_assets: dict[str, str] = {}
+        escaped_specs: dict[str, str] = {}
+
         @self.get(path, middlewares=middlewares, include_in_schema=False, compress=compress)
         def swagger_handler():
             query_params = self.current_event.query_string_parameters or {}
@@ -1894,38 +1899,44 @@ class ApiGatewayResolver(BaseRouter):
                 swagger_css = f"{swagger_base_url}/swagger-ui.min.css"
             else:
                 # We now inject CSS and JS into the SwaggerUI file
-                swagger_js = Path.open(
-                    Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui-bundle.min.js",
-                ).read()
-                swagger_css = Path.open(Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui.min.css").read()
-
-            openapi_servers = servers or [Server(url=(base_path or "/"))]
-
-            spec = self.get_openapi_schema(
-                title=title,
-                version=version,
-                openapi_version=openapi_version,
-                summary=summary,
-                description=description,
-                tags=tags,
-                servers=openapi_servers,
-                terms_of_service=terms_of_service,
-                contact=contact,
-                license_info=license_info,
-                security_schemes=security_schemes,
-                security=security,
-                openapi_extensions=openapi_extensions,
-            )
+                if not swagger_assets:
+                    swagger_ui_path = Path(__file__).parent / "openapi" / "swagger_ui"
+                    swagger_assets["js"] = (swagger_ui_path / "swagger-ui-bundle.min.js").read_text()
+                    swagger_assets["css"] = (swagger_ui_path / "swagger-ui.min.css").read_text()
+                swagger_js = swagger_assets["js"]
+                swagger_css = swagger_assets["css"]
+
+            escaped_spec = escaped_specs.get(base_path)
+            if escaped_spec is None:
+                openapi_servers = servers or [Server(url=(base_path or "/"))]
+
+                spec = self.get_openapi_schema(
+                    title=title,
+                    version=version,
+                    openapi_version=openapi_version,
+                    summary=summary,
+                    description=description,
+                    tags=tags,
+                    servers=openapi_servers,
+                    terms_of_service=terms_of_service,
+                    contact=contact,
+                    license_info=license_info,
+                    security_schemes=security_schemes,
+                    security=security,
+                    openapi_extensions=openapi_extensions,
+                )
 
-            # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string contains
-            # </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON does not
-            # inadvertently close the script tag, and the JSON remains a valid string within the JavaScript code.
-            escaped_spec = model_json(
-                spec,
-                by_alias=True,
-                exclude_none=True,
-                indent=2,
-            ).replace("</", "<\\/")
+                # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string
+                # contains </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON
+                # does not inadvertently close the script tag, and the JSON remains a valid string within the
+                # JavaScript code.
+                escaped_spec = model_json(
+                    spec,
+                    by_alias=True,
+                    exclude_none=True,
+                    indent=2,
+                ).replace("</", "<\\/")
+                escaped_specs[base_path] = escaped_spec
 
             # Check for query parameters; if "format" is specified as "json",
             # respond with the JSON used in the OpenAPI spec
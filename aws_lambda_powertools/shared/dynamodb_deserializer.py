@@ -23,6 +23,21 @@ class TypeDeserializer:
     since we don't support Python 2.
     """
 
+    def __init__(self):
+        # Resolve type tags to bound methods once, rather than with getattr for every value
+        self._deserializers: dict[str, Callable[[Any], Any]] = {
+            "NULL": self._deserialize_null,
+            "BOOL": self._deserialize_bool,
+            "N": self._deserialize_n,
+            "S": self._deserialize_s,
+            "B": self._deserialize_b,
+            "NS": self._deserialize_ns,
+            "SS": self._deserialize_ss,
+            "BS": self._deserialize_bs,
+            "L": self._deserialize_l,
+            "M": self._deserialize_m,
+        }
+
     def deserialize(self, value: dict) -> Any:
         """Deserialize DynamoDB data types into Python types.
 
@@ -58,8 +73,8 @@ class TypeDeserializer:
             Python native type converted from DynamoDB type
         """
 
-        dynamodb_type = list(value.keys())[0]
-        deserializer: Callable | None = getattr(self, f"_deserialize_{dynamodb_type}".lower(), None)
+        dynamodb_type = next(iter(value), "")
+        deserializer = self._deserializers.get(dynamodb_type)
         if deserializer is None:
             raise TypeError(f"Dynamodb type {dynamodb_type} is not supported")
 
@@ -66,6 +66,9 @@ class CaseInsensitiveDict(dict):
 class DictWrapper(Mapping):
     """Provides a single read only access to a wrapper dict"""
 
+    # NOTE: subclasses without instance attributes can declare `__slots__ = ()` to skip the per-instance `__dict__`
+    __slots__ = ("_data", "_json_deserializer")
+
     def __init__(self, data: dict[str, Any], json_deserializer: Callable | None = None):
         """
         Parameters
@@ -17,19 +17,14 @@ class StreamViewType(Enum):
     NEW_AND_OLD_IMAGES = 3  # both the new and the old item images of the item.
 
 
+_STREAM_VIEW_TYPES = {member.name: member for member in StreamViewType}
+
+
 class StreamRecord(DictWrapper):
+    # NOTE: the deserializer is stateless, so a single instance is shared by every record.
+    # StreamRecord keeps its instance __dict__ as it's needed by cached_property.
     _deserializer = TypeDeserializer()
 
-    def __init__(self, data: dict[str, Any]):
-        """StreamRecord constructor
-        Parameters
-        ----------
-        data: dict[str, Any]
-            Represents the dynamodb dict inside DynamoDBStreamEvent's records
-        """
-        super().__init__(data)
-        self._deserializer = TypeDeserializer()
-
     def _deserialize_dynamodb_dict(self, key: str) -> dict[str, Any]:
         """Deserialize DynamoDB records available in `Keys`, `NewImage`, and `OldImage`
 
@@ -82,7 +77,7 @@ class StreamRecord(DictWrapper):
     def stream_view_type(self) -> StreamViewType | None:
         """The type of data from the modified DynamoDB item that was captured in this stream record"""
         item = self.get("StreamViewType")
-        return None if item is None else StreamViewType[str(item)]
+        return None if item is None else _STREAM_VIEW_TYPES[item]
 
 
 class DynamoDBRecordEventName(Enum):
@@ -91,9 +86,14 @@ class DynamoDBRecordEventName(Enum):
     REMOVE = 2  # the item was deleted from the table
 
 
+_EVENT_NAMES = {member.name: member for member in DynamoDBRecordEventName}
+
+
 class DynamoDBRecord(DictWrapper):
     """A description of a unique event within a stream"""
 
+    __slots__ = ()
+
     @property
     def aws_region(self) -> str | None:
         """The region in which the GetRecords request was received"""
@@ -114,7 +114,7 @@ class DynamoDBRecord(DictWrapper):
     def event_name(self) -> DynamoDBRecordEventName | None:
         """The type of data modification that was performed on the DynamoDB table"""
         item = self.get("eventName")
-        return None if item is None else DynamoDBRecordEventName[item]
+        return None if item is None else _EVENT_NAMES[item]
 
     @property
     def event_source(self) -> str | None:
@@ -160,6 +160,8 @@ class DynamoDBStreamEvent(DictWrapper):
                 print(key)
     """
 
+    __slots__ = ()
+
     @property
     def records(self) -> Iterator[DynamoDBRecord]:
         for record in self["Records"]:
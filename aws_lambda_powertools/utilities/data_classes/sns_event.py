@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Iterator
+from typing import Any, Callable, Iterator
 
 from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
 
 
 class SNSMessageAttribute(DictWrapper):
+    __slots__ = ()
+
     @property
     def get_type(self) -> str:
         """The supported message attribute data types are String, String.Array, Number, and Binary."""
@@ -19,6 +21,12 @@ class SNSMessageAttribute(DictWrapper):
 
 
 class SNSMessage(DictWrapper):
+    __slots__ = ("_message_attributes",)
+
+    def __init__(self, data: dict[str, Any], json_deserializer: Callable | None = None):
+        super().__init__(data, json_deserializer)
+        self._message_attributes: dict[str, SNSMessageAttribute] | None = None
+
     @property
     def signature_version(self) -> str:
         """Version of the Amazon SNS signature used."""
@@ -53,7 +61,10 @@ class SNSMessage(DictWrapper):
 
     @property
     def message_attributes(self) -> dict[str, SNSMessageAttribute]:
-        return {k: SNSMessageAttribute(v) for (k, v) in self["MessageAttributes"].items()}
+        if self._message_attributes is None:
+            self._message_attributes = {k: SNSMessageAttribute(v) for (k, v) in self["MessageAttributes"].items()}
+
+        return self._message_attributes
 
     @property
     def get_type(self) -> str:
@@ -82,6 +93,8 @@ class SNSMessage(DictWrapper):
 
 
 class SNSEventRecord(DictWrapper):
+    __slots__ = ()
+
     @property
     def event_version(self) -> str:
         """Event version"""
@@ -98,7 +111,7 @@ class SNSEventRecord(DictWrapper):
 
     @property
     def sns(self) -> SNSMessage:
-        return SNSMessage(self._data["Sns"])
+        return SNSMessage(self._data["Sns"], json_deserializer=self._json_deserializer)
 
 
 class SNSEvent(DictWrapper):
@@ -109,10 +122,12 @@ class SNSEvent(DictWrapper):
     - https://docs.aws.amazon.com/lambda/latest/dg/with-sns.html
     """
 
+    __slots__ = ()
+
     @property
     def records(self) -> Iterator[SNSEventRecord]:
         for record in self["Records"]:
-            yield SNSEventRecord(record)
+            yield SNSEventRecord(data=record, json_deserializer=self._json_deserializer)
 
     @property
     def record(self) -> SNSEventRecord:
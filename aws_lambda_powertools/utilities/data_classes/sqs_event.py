@@ -244,7 +244,7 @@ class SQSRecord(DictWrapper):
         data: S3Event = self._decode_nested_event(S3Event)
         ```
         """
-        return nested_event_class(self.json_body)
+        return nested_event_class(self.json_body, json_deserializer=self._json_deserializer)
 
 
 class SQSEvent(DictWrapper):
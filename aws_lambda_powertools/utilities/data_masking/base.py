@@ -222,20 +222,7 @@ class DataMasking:
                     # If the data for the field is not found, warning.
                     warnings.warn(f"Field or expression {field_parse} not found in {data_parsed}", stacklevel=2)
 
-            # For in-place updates, json_parse accepts a callback function
-            # that receives 3 args: field_value, fields, field_name
-            # We create a partial callback to pre-populate known provider options (action, provider opts, enc ctx)
-            update_callback = functools.partial(
-                self._call_action,
-                action=action,
-                provider_options=provider_options,
-                **encryption_context,  # type: ignore[arg-type]
-            )
-
-            json_parse.update(
-                data_parsed,
-                lambda field_value, fields, field_name: update_callback(field_value, fields, field_name),  # type: ignore[misc] # noqa: B023
-            )
+            json_parse.update(data_parsed, update_callback)
 
         return data_parsed
 
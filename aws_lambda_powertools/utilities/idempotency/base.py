@@ -15,7 +15,8 @@ from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyValidationError,
 )
 from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import (
-    STATUS_CONSTANTS,
+    STATUS_EXPIRED,
+    STATUS_INPROGRESS,
     DataRecord,
 )
 from aws_lambda_powertools.utilities.idempotency.serialization.no_op import (
@@ -67,6 +68,16 @@ class IdempotencyHandler:
     Base class to orchestrate calls to persistence layer.
     """
 
+    __slots__ = (
+        "function",
+        "output_serializer",
+        "data",
+        "fn_args",
+        "fn_kwargs",
+        "config",
+        "persistence_store",
+    )
+
     def __init__(
         self,
         function: Callable,
@@ -119,12 +130,14 @@ class IdempotencyHandler:
         # IdempotencyInconsistentStateError can happen under rare but expected cases
         # when persistent state changes in the small time between put & get requests.
         # In most cases we can retry successfully on this exception.
-        for i in range(MAX_RETRIES + 1):  # pragma: no cover
+        for _ in range(MAX_RETRIES):
             try:
                 return self._process_idempotency()
             except IdempotencyInconsistentStateError:
-                if i == MAX_RETRIES:
-                    raise  # Bubble up when exceeded max tries
+                continue
+
+        # Last attempt; IdempotencyInconsistentStateError bubbles up when exceeded max tries
+        return self._process_idempotency()
 
     def _process_idempotency(self):
         try:
@@ -223,11 +236,14 @@ class IdempotencyHandler:
         IdempotencyInconsistentStateError
             The persistence store reports inconsistent states across different requests. Retryable.
         """
+        # status is computed from the expiry timestamp on each access, so read it once
+        status = data_record.status
+
         # This code path will only be triggered if the record becomes expired between the save_inprogress call and here
-        if data_record.status == STATUS_CONSTANTS["EXPIRED"]:
+        if status == STATUS_EXPIRED:
             raise IdempotencyInconsistentStateError("save_inprogress and get_record return inconsistent results.")
 
-        if data_record.status == STATUS_CONSTANTS["INPROGRESS"]:
+        if status == STATUS_INPROGRESS:
             if data_record.in_progress_expiry_timestamp is not None and data_record.in_progress_expiry_timestamp < int(
                 datetime.datetime.now().timestamp() * 1000,
             ):
@@ -237,7 +253,7 @@ class IdempotencyHandler:
 
             raise IdempotencyAlreadyInProgressError(
                 f"Execution already in progress with idempotency key: "
-                f"{self.persistence_store.event_key_jmespath}={data_record.idempotency_key}",
+                f"{self.persistence_store.event_key_name}={data_record.idempotency_key}",
             )
 
         response_dict = data_record.response_json_as_dict()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.idempotency import IdempotentHookFunction
@@ -20,6 +20,7 @@ class IdempotencyConfig:
         hash_function: str = "md5",
         lambda_context: LambdaContext | None = None,
         response_hook: IdempotentHookFunction | None = None,
+        event_key_fn: Callable[[Any], Any] | None = None,
     ):
         """
         Initialize the base persistence layer
@@ -44,6 +45,9 @@ class IdempotencyConfig:
             Lambda Context containing information about the invocation, function and execution environment.
         response_hook: IdempotentHookFunction, optional
             Hook function to be called when an idempotent response is returned from the idempotent store.
+        event_key_fn: Callable, optional
+            Function to extract the idempotency key from the event record, used instead of event_key_jmespath.
+            It should return None when the key is missing; KeyError and IndexError are treated the same way.
         """
         self.event_key_jmespath = event_key_jmespath
         self.payload_validation_jmespath = payload_validation_jmespath
@@ -55,6 +59,7 @@ class IdempotencyConfig:
         self.hash_function = hash_function
         self.lambda_context: LambdaContext | None = lambda_context
         self.response_hook: IdempotentHookFunction | None = response_hook
+        self.event_key_fn = event_key_fn
 
     def register_lambda_context(self, lambda_context: LambdaContext):
         """Captures the Lambda context, to calculate the remaining time before the invocation times out"""
@@ -11,7 +11,7 @@ import logging
 import os
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 import jmespath
 
@@ -24,7 +24,9 @@ from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyValidationError,
 )
 from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import (
-    STATUS_CONSTANTS,
+    STATUS_COMPLETED,
+    STATUS_CONSTANTS,  # noqa: F401  # backwards compatibility
+    STATUS_INPROGRESS,
     DataRecord,
 )
 from aws_lambda_powertools.utilities.jmespath_utils import PowertoolsFunctions
@@ -46,6 +48,7 @@ class BasePersistenceLayer(ABC):
         self.configured = False
         self.event_key_jmespath: str = ""
         self.event_key_compiled_jmespath = None
+        self.event_key_fn: Callable[[Any], Any] | None = None
         self.jmespath_options: dict | None = None
         self.payload_validation_enabled = False
         self.validation_key_jmespath = None
@@ -72,6 +75,7 @@ class BasePersistenceLayer(ABC):
             return
         self.configured = True
 
+        self.event_key_fn = config.event_key_fn
         self.event_key_jmespath = config.event_key_jmespath
         if config.event_key_jmespath:
             self.event_key_compiled_jmespath = jmespath.compile(config.event_key_jmespath)
@@ -100,25 +104,41 @@ class BasePersistenceLayer(ABC):
         Returns
         -------
         str
-            Hashed representation of the data extracted by the jmespath expression
+            Hashed representation of the data extracted by the event_key_fn or jmespath expression
 
         """
-        if self.event_key_jmespath:
-            data = self.event_key_compiled_jmespath.search(data, options=jmespath.Options(**self.jmespath_options))
-
-        if self.is_missing_idempotency_key(data=data):
+        key_data: Any = data
+        if self.event_key_fn:
+            # A plain function skips JMESPath evaluation entirely
+            # A failed lookup is treated like a JMESPath expression that didn't match, i.e. a missing key
+            try:
+                key_data = self.event_key_fn(data)
+            except (KeyError, IndexError):
+                key_data = None
+        elif self.event_key_jmespath:
+            key_data = self.event_key_compiled_jmespath.search(data, options=jmespath.Options(**self.jmespath_options))
+
+        if self.is_missing_idempotency_key(data=key_data):
             if self.raise_on_no_idempotency_key:
                 raise IdempotencyKeyError("No data found to create a hashed idempotency_key")
 
+            key_source = "event_key_fn" if self.event_key_fn else "jmespath"
             warnings.warn(
-                f"No idempotency key value found. Skipping persistence layer and validation operations. jmespath: {self.event_key_jmespath}",  # noqa: E501
+                f"No idempotency key value found. Skipping persistence layer and validation operations. {key_source}: {self.event_key_name}",  # noqa: E501
                 stacklevel=2,
             )
             return None
 
-        generated_hash = self._generate_hash(data=data)
+        generated_hash = self._generate_hash(data=key_data)
         return f"{self.function_name}#{generated_hash}"
 
+    @property
+    def event_key_name(self) -> str:
+        """Name of the idempotency key source: the event_key_fn qualified name, or the event_key_jmespath expression"""
+        if self.event_key_fn:
+            return getattr(self.event_key_fn, "__qualname__", repr(self.event_key_fn))
+        return self.event_key_jmespath
+
     @staticmethod
     def is_missing_idempotency_key(data) -> bool:
         if isinstance(data, (tuple, list, dict)):
@@ -226,7 +246,7 @@ class BasePersistenceLayer(ABC):
         """
         if not self.use_local_cache:
             return
-        if data_record.status == STATUS_CONSTANTS["INPROGRESS"]:
+        if data_record.status == STATUS_INPROGRESS:
             return
         self._cache[data_record.idempotency_key] = data_record
 
@@ -267,7 +287,7 @@ class BasePersistenceLayer(ABC):
 
         data_record = DataRecord(
             idempotency_key=idempotency_key,
-            status=STATUS_CONSTANTS["COMPLETED"],
+            status=STATUS_COMPLETED,
             expiry_timestamp=self._get_expiry_timestamp(),
             response_data=response_data,
             payload_hash=self._get_hashed_payload(data=data),
@@ -300,7 +320,7 @@ class BasePersistenceLayer(ABC):
 
         data_record = DataRecord(
             idempotency_key=idempotency_key,
-            status=STATUS_CONSTANTS["INPROGRESS"],
+            status=STATUS_INPROGRESS,
             expiry_timestamp=self._get_expiry_timestamp(),
             payload_hash=self._get_hashed_payload(data=data),
         )
@@ -322,8 +342,11 @@ class BasePersistenceLayer(ABC):
 
         logger.debug(f"Saving in progress record for idempotency key: {data_record.idempotency_key}")
 
-        if self._retrieve_from_cache(idempotency_key=data_record.idempotency_key):
-            raise IdempotencyItemAlreadyExistsError
+        cached_record = self._retrieve_from_cache(idempotency_key=data_record.idempotency_key)
+        if cached_record:
+            # Hand over the cached record so the handler doesn't recompute the idempotency key to fetch it again
+            self._validate_payload(data_payload=data_record, stored_data_record=cached_record)
+            raise IdempotencyItemAlreadyExistsError(old_data_record=cached_record)
 
         self._put_record(data_record=data_record)
 
@@ -12,6 +12,9 @@ from types import MappingProxyType
 logger = logging.getLogger(__name__)
 
 STATUS_CONSTANTS = MappingProxyType({"INPROGRESS": "INPROGRESS", "COMPLETED": "COMPLETED", "EXPIRED": "EXPIRED"})
+STATUS_INPROGRESS = STATUS_CONSTANTS["INPROGRESS"]
+STATUS_COMPLETED = STATUS_CONSTANTS["COMPLETED"]
+STATUS_EXPIRED = STATUS_CONSTANTS["EXPIRED"]
 
 
 class DataRecord:
@@ -74,7 +77,7 @@ class DataRecord:
         str
         """
         if self.is_expired:
-            return STATUS_CONSTANTS["EXPIRED"]
+            return STATUS_EXPIRED
         if self._status in STATUS_CONSTANTS.values():
             return self._status
 
@@ -17,7 +17,7 @@ from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyValidationError,
 )
 from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import (
-    STATUS_CONSTANTS,
+    STATUS_INPROGRESS,
     DataRecord,
 )
 
@@ -242,7 +242,7 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
                 ExpressionAttributeValues={
                     ":now": {"N": str(int(now.timestamp()))},
                     ":now_in_millis": {"N": str(int(now.timestamp() * 1000))},
-                    ":inprogress": {"S": STATUS_CONSTANTS["INPROGRESS"]},
+                    ":inprogress": {"S": STATUS_INPROGRESS},
                 },
                 **self.return_value_on_condition,  # type: ignore[arg-type]
             )
@@ -5,7 +5,7 @@ import json
 import logging
 from contextlib import contextmanager
 from datetime import timedelta
-from typing import Any, Literal, Protocol
+from typing import Any, Literal, NoReturn, Protocol
 
 import redis
 
@@ -17,8 +17,9 @@ from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyPersistenceConnectionError,
     IdempotencyPersistenceConsistencyError,
 )
-from aws_lambda_powertools.utilities.idempotency.persistence.base import (
-    STATUS_CONSTANTS,
+from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import (
+    STATUS_COMPLETED,
+    STATUS_INPROGRESS,
     DataRecord,
 )
 
@@ -323,13 +324,16 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
 
     def _item_to_data_record(self, idempotency_key: str, item: dict[str, Any]) -> DataRecord:
         in_progress_expiry_timestamp = item.get(self.in_progress_expiry_attr)
+        if in_progress_expiry_timestamp is not None:
+            in_progress_expiry_timestamp = int(in_progress_expiry_timestamp)
 
+        # Missing attributes fall back to DataRecord defaults rather than being stringified to "None"
         return DataRecord(
             idempotency_key=idempotency_key,
             status=item[self.status_attr],
             in_progress_expiry_timestamp=in_progress_expiry_timestamp,
-            response_data=str(item.get(self.data_attr)),
-            payload_hash=str(item.get(self.validation_key_attr)),
+            response_data=item.get(self.data_attr, ""),
+            payload_hash=item.get(self.validation_key_attr, ""),
             expiry_timestamp=item.get("expiration", None),
         )
 
@@ -411,19 +415,19 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             # (i.e., the expiry timestamp is greater than the current timestamp), then a valid completed
             # record exists. We raise an error to prevent duplicate processing of a request that has already
             # been completed successfully.
-            if idempotency_record.status == STATUS_CONSTANTS["COMPLETED"] and not idempotency_record.is_expired:
-                raise IdempotencyItemAlreadyExistsError
+            if idempotency_record.status == STATUS_COMPLETED and not idempotency_record.is_expired:
+                self._raise_item_already_exists(data_record=data_record, old_data_record=idempotency_record)
 
             # If the idempotency record has a status of 'INPROGRESS' and has a valid in_progress_expiry_timestamp
             # (meaning the timestamp is greater than the current timestamp in milliseconds), then we have encountered
             # a valid in-progress record. This indicates that another process is currently handling the request, and
             # to maintain idempotency, we raise an error to prevent concurrent processing of the same request.
             if (
-                idempotency_record.status == STATUS_CONSTANTS["INPROGRESS"]
+                idempotency_record.status == STATUS_INPROGRESS
                 and idempotency_record.in_progress_expiry_timestamp
                 and idempotency_record.in_progress_expiry_timestamp > int(now.timestamp() * 1000)
             ):
-                raise IdempotencyItemAlreadyExistsError
+                self._raise_item_already_exists(data_record=data_record, old_data_record=idempotency_record)
 
             # Reaching this point indicates that the idempotency record found is an orphan record. An orphan record is
             # one that is neither completed nor in-progress within its expected time frame. It may result from a
@@ -448,6 +452,18 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             logger.debug(f"encountered non-Redis exception: {e}")
             raise e
 
+    def _raise_item_already_exists(self, data_record: DataRecord, old_data_record: DataRecord) -> NoReturn:
+        """
+        Raise IdempotencyItemAlreadyExistsError carrying the record we already fetched from Redis.
+
+        The handler uses `old_data_record` directly instead of issuing another GET, similar to DynamoDB's
+        ReturnValuesOnConditionCheckFailure. Since get_record is skipped in that case, we validate the payload
+        and save the record to the local cache here.
+        """
+        self._validate_payload(data_payload=data_record, stored_data_record=old_data_record)
+        self._save_to_cache(data_record=old_data_record)
+        raise IdempotencyItemAlreadyExistsError(old_data_record=old_data_record)
+
     @contextmanager
     def _acquire_lock(self, name: str):
         """
@@ -473,7 +489,7 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             ...
 
     def _put_record(self, data_record: DataRecord) -> None:
-        if data_record.status == STATUS_CONSTANTS["INPROGRESS"]:
+        if data_record.status == STATUS_INPROGRESS:
             self._put_in_progress_record(data_record=data_record)
         else:
             # current this function only support set in_progress. set complete should use update_record
@@ -10,12 +10,13 @@ from typing import TYPE_CHECKING
 import boto3
 from boto3.dynamodb.conditions import Key
 
+from aws_lambda_powertools.shared import user_agent
 from aws_lambda_powertools.utilities.parameters.base import BaseProvider
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
     from botocore.config import Config
-    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource
+    from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
 
 
 class DynamoDBProvider(BaseProvider):
@@ -174,17 +175,40 @@ class DynamoDBProvider(BaseProvider):
                 stacklevel=2,
             )
 
-        if boto3_client is None:
-            boto3_session = boto3_session or boto3.session.Session()
-            boto3_client = boto3_session.resource("dynamodb", config=boto_config or config, endpoint_url=endpoint_url)
-
-        self.table = boto3_client.Table(table_name)
+        self.table_name = table_name
         self.key_attr = key_attr
         self.sort_attr = sort_attr
         self.value_attr = value_attr
+        self._key = Key(key_attr)
+
+        # When no resource is given, creating it is deferred until the table is first used
+        # so that instantiating the provider at module scope doesn't add to cold start time
+        self._boto3_session = boto3_session
+        self._boto_config = boto_config or config
+        self._endpoint_url = endpoint_url
+        self._table = boto3_client.Table(table_name) if boto3_client is not None else None
 
         super().__init__(resource=boto3_client)
 
+    @property
+    def table(self) -> Table:
+        """DynamoDB Table resource, created on first access when no boto3_client was provided"""
+        if self._table is None:
+            boto3_session = self._boto3_session or boto3.session.Session()
+            boto3_client = boto3_session.resource(
+                "dynamodb",
+                config=self._boto_config,
+                endpoint_url=self._endpoint_url,
+            )
+            user_agent.register_feature_to_resource(resource=boto3_client, feature="parameters")
+            self._table = boto3_client.Table(self.table_name)
+
+        return self._table
+
+    @table.setter
+    def table(self, table: Table) -> None:
+        self._table = table
+
     def _get(self, name: str, **sdk_options) -> str:
         """
         Retrieve a parameter value from Amazon DynamoDB
@@ -217,7 +241,7 @@ class DynamoDBProvider(BaseProvider):
         """
 
         # Explicit arguments will take precedence over keyword arguments
-        sdk_options["KeyConditionExpression"] = Key(self.key_attr).eq(path)
+        sdk_options["KeyConditionExpression"] = self._key.eq(path)
 
         response = self.table.query(**sdk_options)
         items = response.get("Items", [])
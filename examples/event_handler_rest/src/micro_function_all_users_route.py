@@ -41,8 +41,7 @@ app = APIGatewayRestResolver()
 @app.get("/users")
 def all_active_users():
     """HTTP Response for all active users"""
-    all_users = [User(**user) for user in users]
-    all_active_users = [user.__dict__ for user in all_users if user.active]
+    all_active_users = [User(**user).__dict__ for user in users if user["active"]]
 
     return Response(
         status_code=HTTPStatus.OK.value,
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import os
+
+from aws_lambda_powertools.utilities.idempotency import (
+    DynamoDBPersistenceLayer,
+    IdempotencyConfig,
+    idempotent,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+table = os.getenv("IDEMPOTENCY_TABLE", "")
+persistence_layer = DynamoDBPersistenceLayer(table_name=table)
+
+
+def get_idempotency_key(event: dict) -> str | None:
+    # Return None when the header is missing, so it's handled as a missing idempotency key
+    headers = event.get("headers") or {}
+    return headers.get("X-Idempotency-Key")
+
+
+config = IdempotencyConfig(event_key_fn=get_idempotency_key, raise_on_no_idempotency_key=True)
+
+
+@idempotent(config=config, persistence_store=persistence_layer)
+def lambda_handler(event: dict, context: LambdaContext):
+    return {"message": "success", "statusCode": 200}
@@ -6,12 +6,4 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 def lambda_handler(event: dict, context: LambdaContext) -> list:
     parsed_event = parse(model=SqsModel, event=event)
 
-    results = []
-    for record in parsed_event.Records:
-        results.append(
-            {
-                "message_id": record.messageId,
-                "body": record.body,
-            },
-        )
-    return results
+    return [{"message_id": record.messageId, "body": record.body} for record in parsed_event.Records]
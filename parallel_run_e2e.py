@@ -1,6 +1,5 @@
 """ Calculate how many parallel workers are needed to complete E2E infrastructure jobs across available CPU Cores """
-import subprocess
-import sys
+import os
 from pathlib import Path
 
 
@@ -8,9 +7,9 @@ def main():
     features = Path("tests/e2e").rglob("infrastructure.py")
     workers = len(list(features)) - 1
 
-    command = f"poetry run pytest -n {workers} -o log_cli=true tests/e2e"
-    result = subprocess.run(command.split(), shell=False)
-    sys.exit(result.returncode)
+    command = f"poetry run pytest -n {workers} -o log_cli=true tests/e2e".split()
+    # Replace this process with pytest; its exit code becomes ours
+    os.execvp(command[0], command)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import boto3
 from aws_requests_auth.boto_utils import BotoAWSRequestsAuth
 
 
+@lru_cache(maxsize=1)
+def _get_region() -> str:
+    # Creating a boto3 session resolves config files and credentials; do it once per test session
+    return boto3.session.Session().region_name
+
+
 def build_iam_auth(url: str, aws_service: str) -> BotoAWSRequestsAuth:
     """Generates IAM auth keys for a given hostname and service.
     This can be directly passed on to the requests library to authenticate the request.
     """
     hostname = urlparse(url).hostname
-    region = boto3.session.Session().region_name
-    return BotoAWSRequestsAuth(aws_host=hostname, aws_region=region, aws_service=aws_service)
+    return BotoAWSRequestsAuth(aws_host=hostname, aws_region=_get_region(), aws_service=aws_service)
@@ -99,17 +99,21 @@ class LogFetcher:
         return all(hasattr(log, key) for log in self.logs for key in keys)
 
     def _get_logs(self) -> List[Log]:
-        ret = self.log_client.filter_log_events(
+        # FilterLogEvents may return partial or even empty pages along with a nextToken,
+        # so we need to go through all pages before deciding whether logs are available yet
+        paginator = self.log_client.get_paginator("filter_log_events")
+        pages = paginator.paginate(
             logGroupName=self.log_group,
             startTime=self.start_time,
             filterPattern=self.filter_expression,
         )
+        events = [event for page in pages for event in page["events"]]
 
-        if not ret["events"]:
+        if not events:
             raise ValueError("Empty response from Cloudwatch Logs. Repeating...")
 
         filtered_logs = []
-        for event in ret["events"]:
+        for event in events:
             try:
                 message = Log(**json.loads(event["message"]))
             except json.decoder.JSONDecodeError:
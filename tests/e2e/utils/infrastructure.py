@@ -4,6 +4,7 @@ import os
 import subprocess
 import sys
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, Generator, Optional
 from uuid import uuid4
@@ -32,6 +33,12 @@ from tests.e2e.utils.lambda_layer.powertools_layer import LocalLambdaPowertoolsL
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_account_id(region_name: Optional[str]) -> str:
+    # Every feature infrastructure in this process deploys to the same account; ask STS only once
+    return boto3.session.Session(region_name=region_name).client("sts").get_caller_identity()["Account"]
+
+
 class BaseInfrastructure(InfrastructureProvider):
     RANDOM_STACK_VALUE: str = f"{uuid4()}"
 
@@ -44,8 +51,8 @@ class BaseInfrastructure(InfrastructureProvider):
         # NOTE: CDK stack account and region are tokens, we need to resolve earlier
         self.session = boto3.session.Session()
         self.cfn = self.session.client("cloudformation")
-        self.account_id = self.session.client("sts").get_caller_identity()["Account"]
         self.region = self.session.region_name
+        self.account_id = _get_account_id(self.region)
 
         self.app = App()
         self.stack = Stack(self.app, self.stack_name, env=Environment(account=self.account_id, region=self.region))
@@ -176,15 +183,23 @@ class BaseInfrastructure(InfrastructureProvider):
             CloudFormation Stack Outputs with output key and value
         """
         stack_file = self._create_temp_cdk_app()
-        synth_command = f"npx cdk synth --app 'python {stack_file}' -o {self._cdk_out_dir}"
-        deploy_command = (
-            f"npx cdk deploy --app '{self._cdk_out_dir}' -O {self._stack_outputs_file} "
-            "--require-approval=never --method=direct"
-        )
+        synth_command = ["npx", "cdk", "synth", "--app", f"python {stack_file}", "-o", f"{self._cdk_out_dir}"]
+        deploy_command = [
+            "npx",
+            "cdk",
+            "deploy",
+            "--app",
+            f"{self._cdk_out_dir}",
+            "-O",
+            self._stack_outputs_file,
+            "--require-approval=never",
+            "--method=direct",
+        ]
 
         # CDK launches a background task, so we must wait
-        subprocess.check_output(synth_command, shell=True)
-        subprocess.check_output(deploy_command, shell=True)
+        # stdout (e.g., the synthesized template) isn't used; progress and errors are reported on stderr
+        subprocess.run(synth_command, check=True, stdout=subprocess.DEVNULL)
+        subprocess.run(deploy_command, check=True, stdout=subprocess.DEVNULL)
         return self._read_stack_output()
 
     def delete(self) -> None:
@@ -341,15 +356,19 @@ def call_once(
             root_tmp_dir = tmp_path_factory.getbasetemp().parent
             cache = root_tmp_dir / f"{PYTHON_RUNTIME_VERSION}_cache.json"
 
-            with FileLock(f"{cache}.lock"):
-                # If cache exists, return task outputs back
-                # otherwise it's the first run by the main worker
-                # run and return task outputs for subsequent workers reuse
-                if cache.is_file():
-                    callable_result = json.loads(cache.read_text())
-                else:
-                    callable_result: Dict = task()
-                    cache.write_text(json.dumps(callable_result))
+            # Task outputs are published atomically, so once the cache exists
+            # workers can read it without waiting on the lock
+            if not cache.is_file():
+                with FileLock(f"{cache}.lock"):
+                    # Re-check as another worker may have run the task while we waited;
+                    # otherwise it's the first run by the main worker
+                    # run and publish task outputs for subsequent workers reuse
+                    if not cache.is_file():
+                        tmp_cache = cache.with_suffix(".tmp")
+                        tmp_cache.write_text(json.dumps(task()))
+                        tmp_cache.replace(cache)
+
+            callable_result: Dict = json.loads(cache.read_text())
             yield callable_result
     finally:
         if callback is not None:
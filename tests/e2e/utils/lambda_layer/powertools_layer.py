@@ -37,18 +37,27 @@ class LocalLambdaPowertoolsLayer(BaseLocalLambdaLayer):
     def build(self) -> str:
         self.before_build()
 
-        if self._has_source_changed():
+        # A cached build was already cleaned up when it was built; the source hash is only
+        # recorded once build and cleanup succeed, so an interrupted build is redone next time
+        source_hash = dirhash(directory=PACKAGE_PATH, algorithm="md5", ignore=self.IGNORE_EXTENSIONS)
+        if self._has_source_changed(source_hash):
+            self.source_diff_file.unlink(missing_ok=True)
             subprocess.run(self.build_command, shell=True, check=True)
-
-        self.after_build()
+            self.after_build()
+            self.source_diff_file.write_text(source_hash)
 
         return str(self.output_dir)
 
     def after_build(self):
         subprocess.run(self.cleanup_command, shell=True, check=True)
 
-    def _has_source_changed(self) -> bool:
-        """Hashes source code and
+    def _has_source_changed(self, source_hash: str) -> bool:
+        """Compares source code hash with the one recorded by the last successful build
+
+        Parameters
+        ----------
+        source_hash : str
+            Current source code hash
 
         Returns
         -------
@@ -56,12 +65,7 @@ class LocalLambdaPowertoolsLayer(BaseLocalLambdaLayer):
             Whether source code hash has changed
         """
         diff = self.source_diff_file.read_text() if self.source_diff_file.exists() else ""
-        new_diff = dirhash(directory=PACKAGE_PATH, algorithm="md5", ignore=self.IGNORE_EXTENSIONS)
-        if new_diff != diff or not self.output_dir.exists():
-            self.source_diff_file.write_text(new_diff)
-            return True
-
-        return False
+        return source_hash != diff or not self.output_dir.exists()
 
     def _resolve_platform(self, architecture: Architecture) -> str:
         """Returns the correct pip platform tag argument for the manylinux project (see PEP 599)
@@ -22,6 +22,19 @@ def test_openapi_swagger():
     assert result["multiValueHeaders"]["Content-Type"] == ["text/html"]
 
 
+def test_openapi_swagger_builds_schema_once(mocker):
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger()
+    get_openapi_schema = mocker.spy(app, "get_openapi_schema")
+
+    LOAD_GW_EVENT["path"] = "/swagger"
+
+    first = app(LOAD_GW_EVENT, {})
+    second = app(LOAD_GW_EVENT, {})
+    assert first["body"] == second["body"]
+    assert get_openapi_schema.call_count == 1
+
+
 def test_openapi_swagger_compressed():
     app = APIGatewayRestResolver(enable_validation=True)
     app.enable_swagger(compress=True)
@@ -8,10 +8,12 @@ from aws_lambda_powertools.utilities.data_classes import AppSyncResolverEvent
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from tests.functional.utils import load_event
 
+LOAD_DIRECT_RESOLVER_EVENT = load_event("appSyncDirectResolver.json")
+
 
 def test_direct_resolver():
     # Check whether we can handle an example appsync direct resolver
-    mock_event = load_event("appSyncDirectResolver.json")
+    mock_event = LOAD_DIRECT_RESOLVER_EVENT
 
     app = AppSyncResolver()
 
@@ -28,7 +30,7 @@ def test_direct_resolver():
 
 def test_direct_resolver_with_parent_name():
     # Check whether we can handle an example appsync direct resolver
-    mock_event = load_event("appSyncDirectResolver.json")
+    mock_event = LOAD_DIRECT_RESOLVER_EVENT
 
     app = AppSyncResolver()
 
@@ -175,7 +177,7 @@ def test_resolver_async():
 
 def test_resolve_custom_data_model():
     # Check whether we can handle an example appsync direct resolver
-    mock_event = load_event("appSyncDirectResolver.json")
+    mock_event = LOAD_DIRECT_RESOLVER_EVENT
 
     class MyCustomModel(AppSyncResolverEvent):
         @property
@@ -288,7 +290,7 @@ def test_include_router_merges_context():
 
 
 def test_include_router_access_current_event():
-    mock_event = load_event("appSyncDirectResolver.json")
+    mock_event = LOAD_DIRECT_RESOLVER_EVENT
 
     # GIVEN An instance of AppSyncResolver, a Router instance, and a resolver function registered with the router
     app = AppSyncResolver()
@@ -309,7 +311,7 @@ def test_include_router_access_current_event():
 
 def test_app_access_current_event():
     # Check whether we can handle an example appsync direct resolver
-    mock_event = load_event("appSyncDirectResolver.json")
+    mock_event = LOAD_DIRECT_RESOLVER_EVENT
 
     # GIVEN An instance of AppSyncResolver and a resolver function registered with the app
     app = AppSyncResolver()
@@ -367,7 +369,7 @@ def test_route_context_is_manually_cleared_after_resolve_async():
 
 def test_exception_handler_with_single_resolver():
     # GIVEN a AppSyncResolver instance
-    mock_event = load_event("appSyncDirectResolver.json")
+    mock_event = LOAD_DIRECT_RESOLVER_EVENT
 
     app = AppSyncResolver()
 
@@ -306,9 +306,9 @@ def test_idempotent_lambda_first_execution_cached(
     assert save_to_cache_spy.call_args[1]["data_record"].status == "COMPLETED"
     assert persistence_store._cache.get(hashed_idempotency_key).status == "COMPLETED"
 
-    # This lambda call should not call AWS API
+    # This lambda call should not call AWS API, nor look up the local cache twice
     lambda_handler(lambda_apigw_event, lambda_context)
-    assert retrieve_from_cache_spy.call_count == 3
+    assert retrieve_from_cache_spy.call_count == 2
     retrieve_from_cache_spy.assert_called_with(idempotency_key=hashed_idempotency_key)
 
     # This assertion fails if an AWS API operation was called more than once
@@ -1102,6 +1102,24 @@ def test_jmespath_with_powertools_json(
     assert result == "test-func.handler#" + persistence_store._generate_hash(expected_value)
 
 
+def test_event_key_fn_extracts_idempotency_key(persistence_store: DynamoDBPersistenceLayer):
+    # GIVEN an idempotency config with an event_key_fn and an event_key_jmespath
+    config = IdempotencyConfig(
+        event_key_jmespath="body",
+        event_key_fn=lambda event: event["headers"]["X-Idempotency-Key"],
+    )
+    persistence_store.configure(config, "handler")
+    event = {"headers": {"X-Idempotency-Key": "some_key"}, "body": "ignored"}
+
+    # WHEN calling _get_hashed_idempotency_key
+    result = persistence_store._get_hashed_idempotency_key(event)
+
+    # THEN the event_key_fn takes precedence over the jmespath expression
+    assert result == "test-func.handler#" + persistence_store._generate_hash("some_key")
+    # AND the function name is used to describe the key source in error messages
+    assert persistence_store.event_key_name.endswith("<lambda>")
+
+
 @pytest.mark.parametrize("config_with_jmespath_options", ["powertools_json(data).payload"], indirect=True)
 def test_custom_jmespath_function_overrides_builtin_functions(
     config_with_jmespath_options: IdempotencyConfig,
@@ -1172,6 +1190,60 @@ def test_handler_raise_idempotency_key_error(persistence_store: DynamoDBPersiste
     assert "No data found to create a hashed idempotency_key" == e.value.args[0]
 
 
+def test_handler_event_key_fn_missing_key_warns(persistence_store: DynamoDBPersistenceLayer, lambda_context):
+    # GIVEN an event_key_fn that raises KeyError when the header is missing
+    # AND raise_on_no_idempotency_key is False
+    idempotency_config = IdempotencyConfig(event_key_fn=lambda event: event["headers"]["X-Idempotency-Key"])
+    expected_result = {"message": "Foo"}
+
+    @idempotent(persistence_store=persistence_store, config=idempotency_config)
+    def handler(event, context):
+        return expected_result
+
+    # WHEN handling an event without the header
+    # THEN it warns about the missing key and runs the function without persistence
+    with pytest.warns(UserWarning, match="No idempotency key value found"):
+        result = handler({"headers": {}}, lambda_context)
+
+    assert result == expected_result
+
+
+def test_handler_event_key_fn_missing_key_raises(persistence_store: DynamoDBPersistenceLayer, lambda_context):
+    # GIVEN an event_key_fn that raises KeyError when the header is missing
+    # AND raise_on_no_idempotency_key is True
+    idempotency_config = IdempotencyConfig(
+        event_key_fn=lambda event: event["headers"]["X-Idempotency-Key"],
+        raise_on_no_idempotency_key=True,
+    )
+
+    @idempotent(persistence_store=persistence_store, config=idempotency_config)
+    def handler(event, context):
+        raise ValueError("Should not be raised")
+
+    # WHEN handling an event without the header
+    # THEN idempotent raises IdempotencyKeyError instead of a persistence layer error
+    with pytest.raises(IdempotencyKeyError) as e:
+        handler({"headers": {}}, lambda_context)
+
+    assert "No data found to create a hashed idempotency_key" == e.value.args[0]
+
+
+def test_handler_event_key_fn_unrelated_error_propagates(persistence_store: DynamoDBPersistenceLayer, lambda_context):
+    # GIVEN an event_key_fn with a bug raising TypeError, unrelated to a missing key
+    idempotency_config = IdempotencyConfig(event_key_fn=lambda event: event["headers"].get("k", "a", "b"))
+
+    @idempotent(persistence_store=persistence_store, config=idempotency_config)
+    def handler(event, context):
+        raise ValueError("Should not be raised")
+
+    # WHEN handling the idempotent call
+    # THEN the error isn't treated as a missing key and the handler doesn't run
+    with pytest.raises(IdempotencyPersistenceLayerError) as e:
+        handler({"headers": {}}, lambda_context)
+
+    assert isinstance(e.value.__cause__, TypeError)
+
+
 class MockPersistenceLayer(BasePersistenceLayer):
     def __init__(self, expected_idempotency_key: str):
         self.expected_idempotency_key = expected_idempotency_key
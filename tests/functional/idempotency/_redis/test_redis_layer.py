@@ -329,6 +329,20 @@ def test_item_to_datarecord_conversion(valid_record):
     assert record.in_progress_expiry_timestamp == item[layer.in_progress_expiry_attr]
 
 
+@mock.patch("aws_lambda_powertools.utilities.idempotency.persistence.redis.redis", MockRedis())
+def test_item_to_datarecord_conversion_missing_attributes():
+    layer = RedisCachePersistenceLayer(host="host", mode="standalone")
+    # given an in-progress item without data or validation attributes
+    item = {"status": STATUS_CONSTANTS["INPROGRESS"]}
+    # when calling _item_to_data_record
+    record = layer._item_to_data_record(idempotency_key="abc", item=item)
+    # then missing attributes keep the DataRecord defaults
+    assert record.response_data == ""
+    assert record.payload_hash == ""
+    assert record.in_progress_expiry_timestamp is None
+    assert record.response_json_as_dict() is None
+
+
 def test_idempotent_function_and_lambda_handler_redis_basic(
     persistence_store_standalone_redis: RedisCachePersistenceLayer,
     lambda_context,
@@ -524,6 +538,30 @@ def test_idempotent_lambda_redis_in_progress(
         lambda_handler(mock_event, lambda_context)
 
 
+def test_idempotent_lambda_redis_completed_record_fetched_once(
+    persistence_store_standalone_redis: RedisCachePersistenceLayer,
+    lambda_context,
+):
+    mock_event = {"data": "value_single_get"}
+    persistence_layer = persistence_store_standalone_redis
+    result = {"message": "Foo"}
+
+    @idempotent(persistence_store=persistence_layer)
+    def lambda_handler(event, context):
+        return result
+
+    # GIVEN a completed idempotency record already in Redis
+    lambda_handler(mock_event, lambda_context)
+
+    # WHEN invoking the handler again with the same payload
+    with mock.patch.object(persistence_layer.client, "get", wraps=persistence_layer.client.get) as get_spy:
+        handler_result = lambda_handler(mock_event, lambda_context)
+
+    # THEN the stored response is returned using the record fetched while saving in progress
+    assert handler_result == result
+    assert get_spy.call_count == 1
+
+
 def test_idempotent_lambda_redis_delete(
     persistence_store_standalone_redis: RedisCachePersistenceLayer,
     lambda_context,
@@ -243,6 +243,43 @@ def test_dynamodb_provider_get_with_custom_client(mock_name, mock_value, config)
         stubber.deactivate()
 
 
+def test_dynamodb_provider_creates_resource_on_first_use(mocker, config):
+    """
+    Test DynamoDBProvider defers creating the DynamoDB resource until the table is used
+    """
+
+    table_name = "TEST_TABLE"
+    session = mocker.Mock(wraps=boto3.session.Session())
+
+    # Create a new provider
+    provider = parameters.DynamoDBProvider(table_name, boto_config=config, boto3_session=session)
+
+    # No resource is created at initialization
+    session.resource.assert_not_called()
+
+    # The resource is created once and reused
+    table = provider.table
+    assert table.name == table_name
+    assert provider.table is table
+    session.resource.assert_called_once_with("dynamodb", config=config, endpoint_url=None)
+
+
+def test_dynamodb_provider_table_can_be_replaced(mocker, config):
+    """
+    Test DynamoDBProvider allows assigning a custom table without creating a resource
+    """
+
+    session = mocker.Mock(wraps=boto3.session.Session())
+    provider = parameters.DynamoDBProvider("TEST_TABLE", boto_config=config, boto3_session=session)
+    table = mocker.Mock()
+
+    # Assign a custom table, e.g. a stub
+    provider.table = table
+
+    assert provider.table is table
+    session.resource.assert_not_called()
+
+
 def test_dynamodb_provider_get_sdk_options_overwrite(mock_name, mock_value, config):
     """
     Test DynamoDBProvider.get() with SDK options that should be overwritten
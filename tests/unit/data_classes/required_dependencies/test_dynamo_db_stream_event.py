@@ -148,3 +148,13 @@ def test_dynamodb_stream_record_keys_overrides_dict_wrapper_keys():
     data = {"Keys": {"key1": {"N": "101"}}}
     record = StreamRecord(data)
     assert record.keys != data.keys()
+
+
+def test_dynamodb_stream_data_classes_share_deserializer_and_have_no_instance_dict():
+    raw_event = load_event("dynamoStreamEvent.json")
+    parsed_event = DynamoDBStreamEvent(raw_event)
+    record = next(parsed_event.records)
+
+    assert not hasattr(parsed_event, "__dict__")
+    assert not hasattr(record, "__dict__")
+    assert record.dynamodb._deserializer is StreamRecord._deserializer
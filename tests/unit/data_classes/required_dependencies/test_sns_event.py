@@ -29,3 +29,19 @@ def test_sns_trigger_event():
     assert sns.subject == raw_event["Records"][0]["Sns"]["Subject"]
     assert parsed_event.record.raw_event == raw_event["Records"][0]
     assert parsed_event.sns_message == raw_event["Records"][0]["Sns"]["Message"]
+
+
+def test_sns_data_classes_have_no_instance_dict():
+    raw_event = load_event("snsEvent.json")
+    parsed_event = SNSEvent(raw_event)
+    record = parsed_event.record
+
+    for instance in (parsed_event, record, record.sns):
+        assert not hasattr(instance, "__dict__")
+
+
+def test_sns_message_attributes_are_cached():
+    raw_event = load_event("snsEvent.json")
+    sns = SNSEvent(raw_event).record.sns
+
+    assert sns.message_attributes is sns.message_attributes
@@ -164,3 +164,23 @@ def test_sqs_event_typing():
 
     # This assertion compares the return from .items() to the return of __getitem__
     assert list(attributes.items())[0][1] == attributes["key"]
+
+
+def test_decode_nested_event_with_custom_json_deserializer():
+    # GIVEN a custom JSON deserializer, e.g. orjson.loads
+    calls = []
+
+    def custom_deserializer(data):
+        calls.append(data)
+        return json.loads(data)
+
+    raw_event = load_event("snsSqsEvent.json")
+
+    # WHEN the nested SNS message is decoded
+    record = next(SQSEvent(raw_event, json_deserializer=custom_deserializer).records)
+    sns_message: SNSMessage = record.decoded_nested_sns_event
+
+    # THEN the body is parsed once with the custom deserializer
+    # and the nested wrapper keeps using it
+    assert calls == [raw_event["Records"][0]["body"]]
+    assert sns_message._json_deserializer is custom_deserializer